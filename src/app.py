@@ -8,6 +8,7 @@ for extracurricular activities at Mergington High School.
 from fastapi import FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
+from pydantic import BaseModel
 import os
 from pathlib import Path
 
@@ -19,61 +20,72 @@ current_dir = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
           "static")), name="static")
 
+
+class Activity(BaseModel):
+    """Shape of an activity as returned by the API"""
+    description: str
+    schedule: str
+    max_participants: int
+    participants: list[str]
+
+
 # In-memory activity database
+# Participants are dicts with None values used as ordered sets: O(1) membership
+# checks like a set, but they iterate in signup order, which a set would not
 activities = {
     "Chess Club": {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": dict.fromkeys(["michael@mergington.edu", "daniel@mergington.edu"])
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": dict.fromkeys(["emma@mergington.edu", "sophia@mergington.edu"])
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": dict.fromkeys(["john@mergington.edu", "olivia@mergington.edu"])
     },
     "Soccer Team": {
         "description": "Team practices and interschool matches",
         "schedule": "Mondays, Wednesdays, 4:00 PM - 6:00 PM",
         "max_participants": 22,
-        "participants": ["liam@mergington.edu", "noah@mergington.edu"]
+        "participants": dict.fromkeys(["liam@mergington.edu", "noah@mergington.edu"])
     },
     "Swimming Club": {
         "description": "Laps, technique coaching, and friendly competitions",
         "schedule": "Tuesdays and Thursdays, 5:00 PM - 6:30 PM",
         "max_participants": 16,
-        "participants": ["ava@mergington.edu", "isabella@mergington.edu"]
+        "participants": dict.fromkeys(["ava@mergington.edu", "isabella@mergington.edu"])
     },
     "Drama Club": {
         "description": "Acting, stagecraft, and producing school plays",
         "schedule": "Wednesdays, 4:00 PM - 6:00 PM",
         "max_participants": 25,
-        "participants": ["mia@mergington.edu", "charlotte@mergington.edu"]
+        "participants": dict.fromkeys(["mia@mergington.edu", "charlotte@mergington.edu"])
     },
     "Orchestra": {
         "description": "Instrument rehearsals and performances throughout the year",
         "schedule": "Fridays, 4:00 PM - 6:00 PM",
         "max_participants": 40,
-        "participants": ["benjamin@mergington.edu", "lucas@mergington.edu"]
+        "participants": dict.fromkeys(["benjamin@mergington.edu", "lucas@mergington.edu"])
     },
     "Debate Team": {
         "description": "Prepare for and compete in regional and national debate tournaments",
         "schedule": "Tuesdays, 5:00 PM - 7:00 PM",
         "max_participants": 18,
-        "participants": ["elijah@mergington.edu", "amelia@mergington.edu"]
+        "participants": dict.fromkeys(["elijah@mergington.edu", "amelia@mergington.edu"])
     },
     "Science Club": {
         "description": "Hands-on experiments, science fairs, and research projects",
         "schedule": "Thursdays, 3:30 PM - 5:00 PM",
         "max_participants": 20,
-        "participants": ["harper@mergington.edu", "ethan@mergington.edu"]
+        "participants": dict.fromkeys(["harper@mergington.edu", "ethan@mergington.edu"])
     }
 }
 
@@ -83,13 +95,28 @@ def root():
     return RedirectResponse(url="/static/index.html")
 
 
-@app.get("/activities")
+def _activity_response(activity):
+    """Copy an activity with its participants listed in signup order"""
+    return {**activity, "participants": list(activity["participants"])}
+
+
+@app.get("/activities", response_model=dict[str, Activity])
 def get_activities():
-    return activities
+    return {name: _activity_response(activity) for name, activity in activities.items()}
+
+
+@app.get("/activities/{activity_name}", response_model=Activity)
+def get_activity(activity_name: str):
+    """Get the details of a single activity"""
+    # Validate activity exists
+    if activity_name not in activities:
+        raise HTTPException(status_code=404, detail="Activity not found")
+
+    return _activity_response(activities[activity_name])
 
 
 @app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
+def signup_for_activity(activity_name: str, email: str) -> dict[str, str]:
     """Sign up a student for an activity"""
     # Validate activity exists
     if activity_name not in activities:
@@ -103,12 +130,12 @@ def signup_for_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Student already signed up for this activity")
 
     # Add student
-    activity["participants"].append(email)
+    activity["participants"][email] = None
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
 @app.delete("/activities/{activity_name}/unregister")
-def unregister_from_activity(activity_name: str, email: str):
+def unregister_from_activity(activity_name: str, email: str) -> dict[str, str]:
     """Unregister a student from an activity"""
     # Validate activity exists
     if activity_name not in activities:
@@ -122,6 +149,6 @@ def unregister_from_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Student not registered for this activity")
 
     # Remove student
-    activity["participants"].remove(email)
+    del activity["participants"][email]
     return {"message": f"Unregistered {email} from {activity_name}"}
 
@@ -0,0 +1,48 @@
+"""
+Shared fixtures for the Mergington High School Activities API tests
+"""
+
+import copy
+import httpx
+import pytest
+import pytest_asyncio
+
+from app import app, activities, signup_for_activity
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """A single in-process HTTP client shared by the whole session"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as c:
+        yield c
+
+
+@pytest_asyncio.fixture(scope="session")
+async def activities_response(client):
+    """A single GET /activities response shared by the whole session"""
+    return await client.get("/activities")
+
+
+@pytest.fixture(scope="session")
+def baseline(activities_response):
+    """The unmodified activities catalog, decoded once; tests must not mutate it"""
+    return activities_response.json()
+
+
+@pytest.fixture(autouse=True)
+def _reset_activities():
+    """Restore the in-memory activities store after each test"""
+    snapshot = copy.deepcopy(activities)
+    yield
+    activities.clear()
+    activities.update(snapshot)
+
+
+@pytest.fixture
+def registered():
+    """Factory that signs a student up through the handler, skipping HTTP"""
+    def _register(activity_name, email):
+        signup_for_activity(activity_name, email)
+        return email
+    return _register
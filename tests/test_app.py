@@ -3,66 +3,82 @@ Tests for the Mergington High School Activities API
 """
 
 import pytest
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
+from fastapi import HTTPException
+from urllib.parse import quote
 
-# Add src directory to path to import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from app import get_activity, signup_for_activity, unregister_from_activity
 
-from app import app
+# Activity paths, percent-encoded once up front
+CHESS_CLUB = "/activities/" + quote("Chess Club")
+GYM_CLASS = "/activities/" + quote("Gym Class")
+SWIMMING_CLUB = "/activities/" + quote("Swimming Club")
+DRAMA_CLUB = "/activities/" + quote("Drama Club")
+ORCHESTRA = "/activities/" + quote("Orchestra")
 
-client = TestClient(app)
+EXPECTED_ACTIVITIES = frozenset({
+    "Chess Club",
+    "Programming Class",
+    "Gym Class",
+    "Soccer Team",
+    "Swimming Club",
+    "Drama Club",
+    "Orchestra",
+    "Debate Team",
+    "Science Club"
+})
+
+SWIMMERS = ["swimmer1@example.com", "swimmer2@example.com", "swimmer3@example.com"]
 
 
 class TestActivitiesEndpoint:
-    """Tests for the /activities endpoint"""
+    """Tests for the /activities and /activities/{activity_name} endpoints"""
 
-    def test_get_activities_returns_all_activities(self):
+    async def test_get_activities_returns_all_activities(self, activities_response, baseline):
         """Test that GET /activities returns all activities"""
-        response = client.get("/activities")
-        assert response.status_code == 200
+        assert activities_response.status_code == 200
         
-        data = response.json()
-        assert isinstance(data, dict)
-        assert len(data) > 0
+        assert isinstance(baseline, dict)
+        assert len(baseline) > 0
         
         # Verify structure of activities
-        for activity_name, activity_details in data.items():
+        for activity_name, activity_details in baseline.items():
             assert "description" in activity_details
             assert "schedule" in activity_details
             assert "max_participants" in activity_details
             assert "participants" in activity_details
             assert isinstance(activity_details["participants"], list)
 
-    def test_activities_contain_expected_activities(self):
+    async def test_activities_contain_expected_activities(self, baseline):
         """Test that specific activities are present"""
-        response = client.get("/activities")
-        data = response.json()
-        
-        expected_activities = [
-            "Chess Club",
-            "Programming Class",
-            "Gym Class",
-            "Soccer Team",
-            "Swimming Club",
-            "Drama Club",
-            "Orchestra",
-            "Debate Team",
-            "Science Club"
-        ]
+        assert EXPECTED_ACTIVITIES.issubset(baseline.keys())
+
+    async def test_get_single_activity(self, client):
+        """Test that GET /activities/{activity_name} returns just that activity"""
+        response = await client.get(CHESS_CLUB)
+        assert response.status_code == 200
         
-        for activity in expected_activities:
-            assert activity in data
+        data = response.json()
+        assert "description" in data
+        assert "schedule" in data
+        assert "max_participants" in data
+        assert "michael@mergington.edu" in data["participants"]
+
+    def test_get_nonexistent_activity_returns_404(self):
+        """Test that getting a nonexistent activity returns 404"""
+        with pytest.raises(HTTPException) as exc_info:
+            get_activity("Nonexistent Activity")
+        assert exc_info.value.status_code == 404
+        assert "Activity not found" in exc_info.value.detail
 
 
 class TestSignupEndpoint:
     """Tests for the /activities/{activity_name}/signup endpoint"""
 
-    def test_signup_for_activity_success(self):
+    async def test_signup_for_activity_success(self, client):
         """Test successful signup for an activity"""
-        response = client.post(
-            "/activities/Chess Club/signup?email=test@example.com"
+        response = await client.post(
+            f"{CHESS_CLUB}/signup",
+            params={"email": "test@example.com"},
         )
         assert response.status_code == 200
         
@@ -71,79 +87,66 @@ class TestSignupEndpoint:
         assert "test@example.com" in data["message"]
         assert "Chess Club" in data["message"]
 
-    def test_signup_adds_participant_to_activity(self):
+    async def test_signup_adds_participant_to_activity(self, client, baseline):
         """Test that signup actually adds the participant to the activity"""
-        # Get initial participant count
-        response = client.get("/activities")
-        initial_participants = response.json()["Chess Club"]["participants"].copy()
+        before = baseline["Chess Club"]
         
         # Sign up a new participant
         email = "newsignup@example.com"
-        client.post(f"/activities/Chess Club/signup?email={email}")
+        await client.post(f"{CHESS_CLUB}/signup", params={"email": email})
         
         # Verify participant was added
-        response = client.get("/activities")
-        updated_participants = response.json()["Chess Club"]["participants"]
+        after = (await client.get(CHESS_CLUB)).json()
         
-        assert email in updated_participants
-        assert len(updated_participants) == len(initial_participants) + 1
+        assert after["participants"] == before["participants"] + [email]
 
     def test_signup_for_nonexistent_activity_returns_404(self):
         """Test that signup for nonexistent activity returns 404"""
-        response = client.post(
-            "/activities/Nonexistent Activity/signup?email=test@example.com"
-        )
-        assert response.status_code == 404
-        
-        data = response.json()
-        assert "Activity not found" in data["detail"]
+        with pytest.raises(HTTPException) as exc_info:
+            signup_for_activity("Nonexistent Activity", "test@example.com")
+        assert exc_info.value.status_code == 404
+        assert "Activity not found" in exc_info.value.detail
 
     def test_duplicate_signup_returns_400(self):
         """Test that duplicate signup returns 400 error"""
         email = "duplicate@example.com"
-        activity = "Programming Class"
         
         # First signup should succeed
-        response1 = client.post(f"/activities/{activity}/signup?email={email}")
-        assert response1.status_code == 200
+        signup_for_activity("Programming Class", email)
         
         # Second signup with same email should fail
-        response2 = client.post(f"/activities/{activity}/signup?email={email}")
-        assert response2.status_code == 400
-        
-        data = response2.json()
-        assert "already signed up" in data["detail"]
+        with pytest.raises(HTTPException) as exc_info:
+            signup_for_activity("Programming Class", email)
+        assert exc_info.value.status_code == 400
+        assert "already signed up" in exc_info.value.detail
+
+    @pytest.mark.parametrize("email", SWIMMERS)
+    async def test_signup_swimming(self, client, email):
+        """Test that each of several different emails can signup for the same activity"""
+        response = await client.post(f"{SWIMMING_CLUB}/signup", params={"email": email})
+        assert response.status_code == 200
 
-    def test_signup_with_multiple_emails(self):
-        """Test that multiple different emails can signup for same activity"""
-        activity = "Swimming Club"
-        emails = ["swimmer1@example.com", "swimmer2@example.com", "swimmer3@example.com"]
+    async def test_signup_with_multiple_emails(self, client):
+        """Test that multiple different emails can signup and are all listed in the same activity"""
+        for email in SWIMMERS:
+            signup_for_activity("Swimming Club", email)
         
-        for email in emails:
-            response = client.post(f"/activities/{activity}/signup?email={email}")
-            assert response.status_code == 200
+        response = await client.get(SWIMMING_CLUB)
+        participants = response.json()["participants"]
         
-        # Verify all are in the activity
-        response = client.get("/activities")
-        participants = response.json()[activity]["participants"]
-        
-        for email in emails:
+        for email in SWIMMERS:
             assert email in participants
 
 
 class TestUnregisterEndpoint:
     """Tests for the /activities/{activity_name}/unregister endpoint"""
 
-    def test_unregister_from_activity_success(self):
+    async def test_unregister_from_activity_success(self, client, registered):
         """Test successful unregister from an activity"""
-        email = "unregister@example.com"
         activity = "Drama Club"
+        email = registered(activity, "unregister@example.com")
         
-        # First signup
-        client.post(f"/activities/{activity}/signup?email={email}")
-        
-        # Then unregister
-        response = client.delete(f"/activities/{activity}/unregister?email={email}")
+        response = await client.delete(f"{DRAMA_CLUB}/unregister", params={"email": email})
         assert response.status_code == 200
         
         data = response.json()
@@ -151,91 +154,56 @@ class TestUnregisterEndpoint:
         assert email in data["message"]
         assert activity in data["message"]
 
-    def test_unregister_removes_participant(self):
+    async def test_unregister_removes_participant(self, client, registered):
         """Test that unregister actually removes the participant"""
-        email = "removetest@example.com"
-        activity = "Orchestra"
-        
-        # Signup
-        client.post(f"/activities/{activity}/signup?email={email}")
+        email = registered("Orchestra", "removetest@example.com")
         
         # Verify participant is there
-        response = client.get("/activities")
-        participants_before = response.json()[activity]["participants"]
-        assert email in participants_before
+        before = (await client.get(ORCHESTRA)).json()
+        assert email in before["participants"]
         
         # Unregister
-        client.delete(f"/activities/{activity}/unregister?email={email}")
+        await client.delete(f"{ORCHESTRA}/unregister", params={"email": email})
         
         # Verify participant is removed
-        response = client.get("/activities")
-        participants_after = response.json()[activity]["participants"]
-        assert email not in participants_after
-        assert len(participants_after) == len(participants_before) - 1
+        after = (await client.get(ORCHESTRA)).json()
+        assert email not in after["participants"]
+        assert len(after["participants"]) == len(before["participants"]) - 1
 
     def test_unregister_from_nonexistent_activity_returns_404(self):
         """Test that unregister from nonexistent activity returns 404"""
-        response = client.delete(
-            "/activities/Nonexistent Activity/unregister?email=test@example.com"
-        )
-        assert response.status_code == 404
+        with pytest.raises(HTTPException) as exc_info:
+            unregister_from_activity("Nonexistent Activity", "test@example.com")
+        assert exc_info.value.status_code == 404
 
     def test_unregister_unregistered_participant_returns_400(self):
         """Test that unregistering a non-registered participant returns 400"""
-        response = client.delete(
-            "/activities/Debate Team/unregister?email=notregistered@example.com"
-        )
-        assert response.status_code == 400
-        
-        data = response.json()
-        assert "not registered" in data["detail"]
+        with pytest.raises(HTTPException) as exc_info:
+            unregister_from_activity("Debate Team", "notregistered@example.com")
+        assert exc_info.value.status_code == 400
+        assert "not registered" in exc_info.value.detail
 
 
 class TestActivityAvailability:
     """Tests for activity availability (spots left)"""
 
-    def test_availability_decreases_after_signup(self):
-        """Test that available spots decrease after signup"""
-        activity = "Gym Class"
+    async def test_signup_then_unregister_roundtrip(self, client, baseline):
+        """Test that available spots drop after signup and recover after unregister"""
         email = "availtest@example.com"
         
-        response = client.get("/activities")
-        initial_spots = (
-            response.json()[activity]["max_participants"] - 
-            len(response.json()[activity]["participants"])
-        )
-        
-        client.post(f"/activities/{activity}/signup?email={email}")
-        
-        response = client.get("/activities")
-        updated_spots = (
-            response.json()[activity]["max_participants"] - 
-            len(response.json()[activity]["participants"])
-        )
-        
-        assert updated_spots == initial_spots - 1
-
-    def test_availability_increases_after_unregister(self):
-        """Test that available spots increase after unregister"""
-        activity = "Soccer Team"
-        email = "availtest2@example.com"
+        before = baseline["Gym Class"]
+        initial_spots = before["max_participants"] - len(before["participants"])
         
         # Signup
-        client.post(f"/activities/{activity}/signup?email={email}")
+        await client.post(f"{GYM_CLASS}/signup", params={"email": email})
         
-        response = client.get("/activities")
-        spots_after_signup = (
-            response.json()[activity]["max_participants"] - 
-            len(response.json()[activity]["participants"])
-        )
+        after_signup = (await client.get(GYM_CLASS)).json()
+        spots_after_signup = after_signup["max_participants"] - len(after_signup["participants"])
+        assert spots_after_signup == initial_spots - 1
         
         # Unregister
-        client.delete(f"/activities/{activity}/unregister?email={email}")
-        
-        response = client.get("/activities")
-        spots_after_unregister = (
-            response.json()[activity]["max_participants"] - 
-            len(response.json()[activity]["participants"])
-        )
+        await client.delete(f"{GYM_CLASS}/unregister", params={"email": email})
         
+        after_unregister = (await client.get(GYM_CLASS)).json()
+        spots_after_unregister = after_unregister["max_participants"] - len(after_unregister["participants"])
         assert spots_after_unregister == spots_after_signup + 1